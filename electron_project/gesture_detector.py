@@ -1,16 +1,52 @@
 
 import Quartz
+import os
 import time
-import math
 import sys
 import json
 from threading import Thread
 
+try:
+    import numpy as np
+
+    from utils_numba import _detect_circular, warm_up
+except ImportError as e:
+    # Exit cleanly so main.js reports the error instead of restarting us in a loop
+    print(json.dumps({'type': 'error', 'message': f'Missing gesture detector dependency ({e}). Install requirements.txt into venv/.'}))
+    sys.stdout.flush()
+    sys.exit(0)
+
+GESTURE_BUFFER_SIZE = 256  # Ring buffer capacity (3s of points at 20Hz is ~60)
+GESTURE_WINDOW = 30  # Number of recent points fed to the detector
+
+# Tracking flag shared between the event tap and the stdin command thread.
+# Writers replace the single element; the tap only does one unlocked load.
+_tracking = [False]
+
+# Bound once so the per-event callback avoids module attribute lookups
+_CGEventGetLocation = Quartz.CGEventGetLocation
+_MOUSE_MOVED = Quartz.kCGEventMouseMoved
+_time = time.time
+
+# Status messages are encoded once and written straight to fd 1, bypassing
+# print()/json.dumps() and the stdout lock on the event tap thread
+_STDOUT_FD = 1
+_MSG_ERROR_NO_TAP = (json.dumps({'type': 'error', 'message': 'Failed to create event tap. Need accessibility permissions.'}) + '\n').encode()
+_MSG_STARTED = (json.dumps({'type': 'started', 'message': 'Global gesture detection started'}) + '\n').encode()
+_MSG_STOPPED = (json.dumps({'type': 'stopped', 'message': 'Global gesture detection stopped'}) + '\n').encode()
+_MSG_GESTURE_DETECTED = b'{"type": "gesture_detected", "points": %d}\n'
+
 class GlobalGestureDetector:
     def __init__(self):
-        self.gesture_points = []
-        self.is_tracking = False
-        self.last_pos = None
+        # Gesture points as parallel ring buffers. x/y are mirrored into a
+        # second half so the most recent window is always a contiguous slice.
+        self._xs = np.empty(2 * GESTURE_BUFFER_SIZE, 'f8')
+        self._ys = np.empty(2 * GESTURE_BUFFER_SIZE, 'f8')
+        self._ts = np.empty(GESTURE_BUFFER_SIZE, 'f8')
+        self._head = 0  # Total points appended
+        self._tail = 0  # Index of the oldest live point
+        self.last_x = None  # Last recorded position, kept as floats to avoid a dict per event
+        self.last_y = None
         self.gesture_start_time = 0
         self.movement_threshold = 5  # Minimum movement to register
         self.last_check_time = 0
@@ -18,85 +54,76 @@ class GlobalGestureDetector:
         self.detection_cooldown = 2.0  # 2 second cooldown between detections
         
     def mouse_event_callback(self, proxy, event_type, event, refcon):
-        if not self.is_tracking:
+        if not _tracking[0]:
             return event
             
-        location = Quartz.CGEventGetLocation(event)
+        location = _CGEventGetLocation(event)
         x, y = location.x, location.y
-        current_time = time.time()
+        current_time = _time()
         
         # Track all mouse movements, not just clicks
-        if event_type == Quartz.kCGEventMouseMoved:
+        if event_type == _MOUSE_MOVED:
             # Only process if enough time has passed and mouse moved significantly
             if (current_time - self.last_check_time > 0.05 and  # 50ms throttle
-                (self.last_pos is None or 
-                 abs(x - self.last_pos['x']) > self.movement_threshold or 
-                 abs(y - self.last_pos['y']) > self.movement_threshold)):
+                (self.last_x is None or 
+                 abs(x - self.last_x) > self.movement_threshold or 
+                 abs(y - self.last_y) > self.movement_threshold)):
                 
-                self.gesture_points.append({'x': x, 'y': y, 'time': current_time})
-                self.last_pos = {'x': x, 'y': y}
+                self._append_point(x, y, current_time)
+                self.last_x = x
+                self.last_y = y
                 self.last_check_time = current_time
                 
                 # Keep only recent points (last 3 seconds for natural movement)
-                self.gesture_points = [p for p in self.gesture_points if current_time - p['time'] < 3.0]
+                self._trim_stale(current_time)
                 
                 # Check for circular gesture continuously (increased threshold)
-                if (len(self.gesture_points) > 30 and 
+                if (self._head - self._tail > GESTURE_WINDOW and 
                     current_time - self.last_detection_time > self.detection_cooldown and 
                     self.detect_circular_gesture()):
-                    print(json.dumps({'type': 'gesture_detected', 'points': len(self.gesture_points)}))
-                    sys.stdout.flush()
+                    os.write(_STDOUT_FD, _MSG_GESTURE_DETECTED % (self._head - self._tail))
                     # Clear ALL points and set cooldown to avoid repeated triggers
-                    self.gesture_points = []
+                    self._tail = self._head
                     self.last_detection_time = current_time
                 
         return event
     
+    def _append_point(self, x, y, t):
+        i = self._head % GESTURE_BUFFER_SIZE
+        self._xs[i] = self._xs[i + GESTURE_BUFFER_SIZE] = x
+        self._ys[i] = self._ys[i + GESTURE_BUFFER_SIZE] = y
+        self._ts[i] = t
+        self._head += 1
+        # Drop the oldest point if the buffer is full
+        if self._head - self._tail > GESTURE_BUFFER_SIZE:
+            self._tail = self._head - GESTURE_BUFFER_SIZE
+    
+    def _trim_stale(self, current_time):
+        # Keep only recent points (last 3 seconds for natural movement)
+        while self._tail < self._head and current_time - self._ts[self._tail % GESTURE_BUFFER_SIZE] >= 3.0:
+            self._tail += 1
+    
+    def _recent_window(self, n):
+        # Contiguous views over the last n points, oldest first
+        end = self._head % GESTURE_BUFFER_SIZE + GESTURE_BUFFER_SIZE
+        return self._xs[end - n:end], self._ys[end - n:end]
+    
     def detect_circular_gesture(self):
-        if len(self.gesture_points) < 25:  # Increased minimum points
+        count = self._head - self._tail
+        if count < 25:  # Increased minimum points
             return False
             
-        recent_points = self.gesture_points[-30:]  # More points for better detection
+        xs, ys = self._recent_window(min(count, GESTURE_WINDOW))  # More points for better detection
         
-        # Calculate center
-        center_x = sum(p['x'] for p in recent_points) / len(recent_points)
-        center_y = sum(p['y'] for p in recent_points) / len(recent_points)
-        
-        # Calculate minimum radius requirement
-        distances = []
-        for point in recent_points:
-            distance = math.sqrt((point['x'] - center_x)**2 + (point['y'] - center_y)**2)
-            distances.append(distance)
-        avg_radius = sum(distances) / len(distances)
-        
-        # Require minimum radius of 50 pixels to prevent accidental detection
-        if avg_radius < 50:
-            return False
-        
-        # Calculate angles
-        angles = []
-        for point in recent_points:
-            angle = math.atan2(point['y'] - center_y, point['x'] - center_x)
-            angles.append(angle)
-        
-        # Check total angle change
-        total_angle_change = 0
-        for i in range(1, len(angles)):
-            angle_diff = angles[i] - angles[i-1]
-            
-            # Normalize angle difference
-            if angle_diff > math.pi:
-                angle_diff -= 2 * math.pi
-            elif angle_diff < -math.pi:
-                angle_diff += 2 * math.pi
-                
-            total_angle_change += abs(angle_diff)
-        
-        # Require at least 80% of a full circle for more reliable detection
-        return total_angle_change > math.pi * 1.6
+        # Centroid, radius and angle checks run in the compiled kernel
+        return bool(_detect_circular(xs, ys))
     
     def start_monitoring(self):
-        self.is_tracking = True
+        # Compile the detection kernels before the tap exists so the first
+        # event isn't stalled; 'started' is only reported once this is done
+        warm_up(GESTURE_WINDOW)
+        
+        _tracking[0] = True
         event_mask = (
             Quartz.CGEventMaskBit(Quartz.kCGEventMouseMoved)
         )
@@ -111,8 +138,7 @@ class GlobalGestureDetector:
         )
         
         if tap is None:
-            print(json.dumps({'type': 'error', 'message': 'Failed to create event tap. Need accessibility permissions.'}))
-            sys.stdout.flush()
+            os.write(_STDOUT_FD, _MSG_ERROR_NO_TAP)
             return
             
         run_loop_source = Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
@@ -123,14 +149,12 @@ class GlobalGestureDetector:
         )
         
         Quartz.CGEventTapEnable(tap, True)
-        print(json.dumps({'type': 'started', 'message': 'Global gesture detection started'}))
-        sys.stdout.flush()
+        os.write(_STDOUT_FD, _MSG_STARTED)
         
         try:
             Quartz.CFRunLoopRun()
         except KeyboardInterrupt:
-            print(json.dumps({'type': 'stopped', 'message': 'Global gesture detection stopped'}))
-            sys.stdout.flush()
+            os.write(_STDOUT_FD, _MSG_STOPPED)
 
 if __name__ == '__main__':
     detector = GlobalGestureDetector()
@@ -141,9 +165,9 @@ if __name__ == '__main__':
             try:
                 cmd = json.loads(line.strip())
                 if cmd.get('action') == 'start':
-                    detector.is_tracking = True
+                    _tracking[0] = True
                 elif cmd.get('action') == 'stop':
-                    detector.is_tracking = False
+                    _tracking[0] = False
                 elif cmd.get('action') == 'quit':
                     break
             except:
@@ -3,13 +3,37 @@ import json
 import sys
 from dedalus_labs import AsyncDedalus, DedalusRunner
 from dotenv import load_dotenv
-from dedalus_labs.utils.streaming import stream_async
 
 load_dotenv()
 
 # Hardcoded Anthropic Claude Sonnet 4 model
 MODEL = "anthropic/claude-sonnet-4-20250514"
 
+# Shared client/runner, reused across calls on the same event loop. The
+# client's HTTP connection pool is bound to the loop that first used it.
+_CLIENT = None
+_RUNNER = None
+_RUNNER_LOOP = None
+
+def _get_runner():
+    """
+    Return the shared DedalusRunner for the running event loop
+    
+    A new client is created on first use and whenever the loop changes
+    (e.g. separate asyncio.run() calls), since the old pool can't be used
+    from a different loop.
+    
+    Returns:
+        DedalusRunner: Runner bound to the module-level AsyncDedalus client
+    """
+    global _CLIENT, _RUNNER, _RUNNER_LOOP
+    loop = asyncio.get_running_loop()
+    if _RUNNER is None or _RUNNER_LOOP is not loop:
+        _CLIENT = AsyncDedalus()
+        _RUNNER = DedalusRunner(_CLIENT)
+        _RUNNER_LOOP = loop
+    return _RUNNER
+
 async def run_dedalus_task(input_text, mcp_agent, stream=False):
     """
     Run a Dedalus task with MCP server integration using Claude Sonnet 4
@@ -17,23 +41,43 @@ async def run_dedalus_task(input_text, mcp_agent, stream=False):
     Args:
         input_text (str): The input prompt/task
         mcp_agent (str): MCP agent/server to use (e.g., "tsion/brave-search-mcp")
-        stream (bool): Whether to stream the response
+        stream (bool): Whether to stream the response. Content chunks are
+            written to stdout as {"type": "chunk"} JSON lines as they arrive
     
     Returns:
-        dict: Result containing final_output and metadata
+        dict: Result containing final_output and metadata. When streaming,
+            a {"type": "done"} record without final_output. Failures return
+            a {"type": "error"} record, which also ends a stream
     """
     try:
-        client = AsyncDedalus()
-        runner = DedalusRunner(client)
+        runner = _get_runner()
 
         # Convert single agent to list format
         mcp_servers = [mcp_agent] if isinstance(mcp_agent, str) else mcp_agent
 
+        if stream:
+            async for chunk in runner.run(
+                input=input_text,
+                model=MODEL,
+                mcp_servers=mcp_servers,
+                stream=True
+            ):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    sys.stdout.write(json.dumps({"type": "chunk", "data": chunk.choices[0].delta.content}) + "\n")
+                    sys.stdout.flush()
+
+            return {
+                "type": "done",
+                "success": True,
+                "model": MODEL,
+                "mcp_agent": mcp_agent,
+                "timestamp": asyncio.get_event_loop().time()
+            }
+
         result = await runner.run(
             input=input_text,
             model=MODEL,
-            mcp_servers=mcp_servers,
-            stream=stream
+            mcp_servers=mcp_servers
         )
 
         return {
@@ -46,6 +90,7 @@ async def run_dedalus_task(input_text, mcp_agent, stream=False):
     
     except Exception as e:
         return {
+            "type": "error",
             "success": False,
             "error": str(e),
             "model": MODEL,
@@ -56,19 +101,20 @@ async def run_dedalus_task(input_text, mcp_agent, stream=False):
 async def main():
     """
     Main function that reads arguments from command line and executes Dedalus task
-    Expected arguments: prompt mcp_agent
+    Expected arguments: prompt mcp_agent [--stream]
     """
-    if len(sys.argv) != 3:
+    stream = len(sys.argv) == 4 and sys.argv[3] == "--stream"
+    if len(sys.argv) != 3 and not stream:
         print(json.dumps({
             "success": False,
-            "error": "Usage: python dedalus_client.py <prompt> <mcp_agent>"
+            "error": "Usage: python dedalus_client.py <prompt> <mcp_agent> [--stream]"
         }))
         return
     
     prompt = sys.argv[1]
     mcp_agent = sys.argv[2]
     
-    result = await run_dedalus_task(prompt, mcp_agent)
+    result = await run_dedalus_task(prompt, mcp_agent, stream=stream)
     print(json.dumps(result))
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import importlib.util
+import math
+import os
+import random
+import sys
+import types
+
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+if importlib.util.find_spec('Quartz') is None:
+    # Off macOS: only the names gesture_detector binds at import are needed
+    sys.modules['Quartz'] = types.SimpleNamespace(CGEventGetLocation=None, kCGEventMouseMoved=5)
+
+import gesture_detector
+
+
+class BaselineDetector:
+    """Original list-of-dicts detector, kept as the reference behaviour"""
+
+    def __init__(self):
+        self.gesture_points = []
+        self.last_pos = None
+        self.movement_threshold = 5
+        self.last_check_time = 0
+        self.last_detection_time = 0
+        self.detection_cooldown = 2.0
+        self.detections = []
+
+    def feed(self, x, y, current_time):
+        if (current_time - self.last_check_time > 0.05 and
+            (self.last_pos is None or
+             abs(x - self.last_pos['x']) > self.movement_threshold or
+             abs(y - self.last_pos['y']) > self.movement_threshold)):
+            self.gesture_points.append({'x': x, 'y': y, 'time': current_time})
+            self.last_pos = {'x': x, 'y': y}
+            self.last_check_time = current_time
+            self.gesture_points = [p for p in self.gesture_points if current_time - p['time'] < 3.0]
+            if (len(self.gesture_points) > 30 and
+                current_time - self.last_detection_time > self.detection_cooldown and
+                self.detect_circular_gesture()):
+                self.detections.append((current_time, len(self.gesture_points)))
+                self.gesture_points = []
+                self.last_detection_time = current_time
+
+    def detect_circular_gesture(self):
+        if len(self.gesture_points) < 25:
+            return False
+        recent_points = self.gesture_points[-30:]
+        center_x = sum(p['x'] for p in recent_points) / len(recent_points)
+        center_y = sum(p['y'] for p in recent_points) / len(recent_points)
+        distances = [math.sqrt((p['x'] - center_x)**2 + (p['y'] - center_y)**2) for p in recent_points]
+        if sum(distances) / len(distances) < 50:
+            return False
+        angles = [math.atan2(p['y'] - center_y, p['x'] - center_x) for p in recent_points]
+        total_angle_change = 0
+        for i in range(1, len(angles)):
+            angle_diff = angles[i] - angles[i-1]
+            if angle_diff > math.pi:
+                angle_diff -= 2 * math.pi
+            elif angle_diff < -math.pi:
+                angle_diff += 2 * math.pi
+            total_angle_change += abs(angle_diff)
+        return total_angle_change > math.pi * 1.6
+
+
+def drifting_circle(rng, start_time):
+    """Mouse samples for a few loops drawn while the hand drifts sideways"""
+    cx, cy = rng.uniform(200, 1200), rng.uniform(200, 800)
+    vx, vy = rng.uniform(-150, 150), rng.uniform(-150, 150)  # Drift in px/s
+    radius = rng.uniform(30, 200)
+    omega = rng.choice([-1, 1]) * rng.uniform(1.5, 8.0)  # rad/s
+    t = start_time
+    for _ in range(rng.randint(40, 250)):
+        t += rng.uniform(0.03, 0.09)
+        elapsed = t - start_time
+        a = omega * elapsed
+        yield (cx + vx * elapsed + radius * math.cos(a) + rng.gauss(0, 2),
+               cy + vy * elapsed + radius * math.sin(a) + rng.gauss(0, 2),
+               t)
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    clock = [0.0]
+    written = []
+
+    def fake_write(fd, data):
+        assert fd == gesture_detector._STDOUT_FD
+        written.append((clock[0], data))
+        return len(data)
+
+    monkeypatch.setattr(gesture_detector, '_time', lambda: clock[0])
+    monkeypatch.setattr(gesture_detector, '_CGEventGetLocation', lambda event: types.SimpleNamespace(x=event[0], y=event[1]))
+    monkeypatch.setattr(gesture_detector.os, 'write', fake_write)
+    monkeypatch.setattr(gesture_detector, '_tracking', [True])
+    return gesture_detector.GlobalGestureDetector(), clock, written
+
+
+def test_matches_baseline_on_drifting_circles(detector):
+    new, clock, written = detector
+    baseline = BaselineDetector()
+    rng = random.Random(1234)
+    t = 1000.0
+    for _ in range(300):
+        for x, y, t in drifting_circle(rng, t):
+            clock[0] = t
+            new.mouse_event_callback(None, gesture_detector._MOUSE_MOVED, (x, y), None)
+            baseline.feed(x, y, t)
+        t += rng.uniform(0.0, 4.0)  # Pause between gestures
+
+    expected = [(t, gesture_detector._MSG_GESTURE_DETECTED % n) for t, n in baseline.detections]
+    assert len(expected) > 50
+    assert written == expected
+
+
+def test_straight_line_is_not_a_gesture(detector):
+    new, clock, written = detector
+    for i in range(200):
+        clock[0] = 1000.0 + i * 0.06
+        new.mouse_event_callback(None, gesture_detector._MOUSE_MOVED, (i * 10.0, i * 3.0), None)
+    assert written == []
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Fall back to plain Python if Numba isn't installed
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+_TWO_PI = 2.0 * math.pi
+_INV_TWO_PI = 1.0 / _TWO_PI
+
+
+@njit(cache=True, fastmath=True)
+def _wrap_angle(d):
+    """Normalize an angle difference into [-pi, pi] without branching"""
+    return d - _TWO_PI * round(d * _INV_TWO_PI)
+
+
+# Pick the detection kernel: JIT-compiled loop with Numba, vectorized NumPy without
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _detect_circular(xs, ys):
+        """
+        Check whether a trace of points forms a circular gesture
+
+        Args:
+            xs (float64[::1]): Contiguous x coordinates, oldest first
+            ys (float64[::1]): Contiguous y coordinates, oldest first
+
+        Returns:
+            bool: True if the trace covers at least 80% of a full circle
+        """
+        n = xs.shape[0]
+        if n < 2:
+            return False
+
+        cx = xs.mean()
+        cy = ys.mean()
+
+        # Radii and angles around the centroid in a single pass
+        ang = np.empty(n, dtype=np.float64)
+        r_sum = 0.0
+        for i in range(n):
+            dx = xs[i] - cx
+            dy = ys[i] - cy
+            r_sum += math.sqrt(dx * dx + dy * dy)
+            ang[i] = math.atan2(dy, dx)
+
+        # Require minimum radius of 50 pixels to prevent accidental detection
+        if r_sum / n < 50.0:
+            return False
+
+        total = 0.0
+        for i in range(1, n):
+            total += abs(_wrap_angle(ang[i] - ang[i - 1]))
+
+        return total > math.pi * 1.6
+else:
+    def _detect_circular(xs, ys):
+        """Vectorized NumPy version of the kernel above, used when Numba is unavailable"""
+        if xs.shape[0] < 2:
+            return False
+
+        cx, cy = xs.mean(), ys.mean()
+        # Require minimum radius of 50 pixels to prevent accidental detection
+        if np.hypot(xs - cx, ys - cy).mean() < 50.0:
+            return False
+
+        d = np.diff(np.arctan2(ys - cy, xs - cx))
+        d -= _TWO_PI * np.round(d * _INV_TWO_PI)
+        return np.abs(d).sum() > math.pi * 1.6
+
+
+def warm_up(n=30):
+    """
+    Compile all kernels ahead of the event tap's hot path
+
+    With Numba this forces codegen, and cache=True writes the compiled code
+    to __pycache__ so later launches load it instead of recompiling.
+    Without Numba it just runs the NumPy kernel once.
+
+    Args:
+        n (int): Number of points in the dummy trace, matching the detector window
+    """
+    t = np.linspace(0.0, 2.0 * math.pi, n)
+    xs = np.ascontiguousarray(100.0 * np.cos(t))
+    ys = np.ascontiguousarray(100.0 * np.sin(t))
+    _detect_circular(xs, ys)
+    _wrap_angle(0.0)